@@ -107,4 +107,8 @@ notes:
     standard environment variables, then finally by explicit parameters in
     plays. More information can be found at
     U(https://docs.openstack.org/openstacksdk/)
+  - Each task authenticates against Keystone anew. To reuse tokens across
+    tasks, enable openstacksdk's auth cache by setting C(auth) to C(true)
+    in the C(cache) section of clouds.yaml. This requires the python C(keyring)
+    library on the host executing the module.
 '''
@@ -329,10 +329,11 @@ class OpenStackModule:
 
         # Fail if there are set unsupported for this version parameters
         # New parameters should NOT use 'default' but rely on SDK defaults
+        sdk_version = StrictVersion(self.sdk_version)
         for param in self.argument_spec:
             if (self.params[param] is not None
                 and 'min_ver' in self.argument_spec[param]
-                    and StrictVersion(self.sdk_version) < self.argument_spec[param]['min_ver']):
+                    and sdk_version < self.argument_spec[param]['min_ver']):
                 self.fail_json(
                     msg="To use parameter '{param}' with module '{module}', the installed version of "
                     "the openstacksdk library MUST be >={min_version}.".format(
@@ -341,7 +342,7 @@ class OpenStackModule:
                         module=self.module_name))
             if (self.params[param] is not None
                 and 'max_ver' in self.argument_spec[param]
-                    and StrictVersion(self.sdk_version) > self.argument_spec[param]['max_ver']):
+                    and sdk_version > self.argument_spec[param]['max_ver']):
                 self.fail_json(
                     msg="To use parameter '{param}' with module '{module}', the installed version of "
                     "the openstacksdk library MUST be <={max_version}.".format(
@@ -392,12 +393,13 @@ class OpenStackModule:
                                     are dropped.
         """
         versioned_result = {}
+        sdk_version = StrictVersion(self.sdk_version)
         for var_name in kwargs:
             if ('min_ver' in self.argument_spec[var_name]
-                    and StrictVersion(self.sdk_version) < self.argument_spec[var_name]['min_ver']):
+                    and sdk_version < self.argument_spec[var_name]['min_ver']):
                 continue
             if ('max_ver' in self.argument_spec[var_name]
-                    and StrictVersion(self.sdk_version) > self.argument_spec[var_name]['max_ver']):
+                    and sdk_version > self.argument_spec[var_name]['max_ver']):
                 continue
             versioned_result.update({var_name: kwargs[var_name]})
         return versioned_result
@@ -16,8 +16,35 @@ options:
    name:
      description:
         - Name to be assigned to the network.
-     required: true
+        - One of I(name) or I(names) is required.
      type: str
+   names:
+     description:
+        - List of names of networks to be managed together.
+        - All other options are applied to each of the networks and existing
+          networks are fetched with a single API call instead of one lookup
+          per network.
+        - Prefer I(names) over looping this module over I(name) when
+          managing many networks, because every loop iteration runs the
+          module and authenticates against the cloud again.
+        - Mutually exclusive with I(name).
+     type: list
+     elements: str
+   return_network:
+     description:
+        - Whether to return all attributes of the networks.
+        - When C(false), the returned I(network) and I(networks) only contain
+          the I(id) and I(name) of the networks.
+     type: bool
+     default: true
+   concurrency:
+     description:
+        - Maximum number of networks from I(names) to create, update or
+          delete in parallel.
+        - Only used with I(names), but always validated to be a positive
+          integer.
+     type: int
+     default: 1
    shared:
      description:
         - Whether this network is shared or not.
@@ -85,16 +112,32 @@ EXAMPLES = '''
     state: present
     name: ext_network
     external: true
+
+# Create several internal networks in a single task.
+- openstack.cloud.network:
+    cloud: mycloud
+    state: present
+    names:
+      - net1
+      - net2
+      - net3
 '''
 
 RETURN = '''
 id:
     description: Id of network
-    returned: On success when network exists.
+    returned: On success when network exists and I(name) is used.
     type: str
+networks:
+    description: List of dictionaries describing the networks, in the same
+                 order as I(names). See I(network) for the returned keys.
+    returned: On success when I(names) is used and I(state) is C(present).
+    type: list
+    elements: dict
 network:
-    description: Dictionary describing the network.
-    returned: On success when network exists.
+    description: Dictionary describing the network. Only contains I(id)
+                 and I(name) if I(return_network) is C(false).
+    returned: On success when network exists and I(name) is used.
     type: dict
     contains:
         availability_zone_hints:
@@ -180,13 +223,18 @@ network:
             type: str
 '''
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from ansible_collections.openstack.cloud.plugins.module_utils.openstack import OpenStackModule
 
 
 class NetworkModule(OpenStackModule):
 
     argument_spec = dict(
-        name=dict(required=True),
+        name=dict(),
+        names=dict(type='list', elements='str'),
+        concurrency=dict(type='int', default=1),
+        return_network=dict(type='bool', default=True),
         shared=dict(type='bool'),
         admin_state_up=dict(type='bool'),
         external=dict(type='bool'),
@@ -200,100 +248,235 @@ class NetworkModule(OpenStackModule):
         dns_domain=dict()
     )
 
+    module_kwargs = dict(
+        mutually_exclusive=[('name', 'names')],
+        required_one_of=[('name', 'names')],
+    )
+
+    # Properties that cannot be modified once the network has been created
+    non_updatable_attrs = (
+        'provider_network_type',
+        'provider_physical_network',
+    )
+
+    # Restrict update call to properties which can be modified. Adapted from:
+    # https://github.com/openstack/openstacksdk/blob/1ce15c9a8758b4d978eb5239bae100ddc13c8875/openstack/cloud/_network.py#L559-L561
+    updatable_attrs = (
+        'shared', 'admin_state_up', 'is_router_external', 'mtu',
+        'port_security_enabled', 'dns_domain', 'provider_segmentation_id',
+    )
+
+    # Attributes of the network resource which are named differently from
+    # the arguments accepted by create_network and update_network
+    attr_mappings = {
+        'shared': 'is_shared',
+        'admin_state_up': 'is_admin_state_up',
+        'port_security_enabled': 'is_port_security_enabled',
+    }
+
+    def _build_kwargs(self):
+        """Build the attributes to create or update networks with."""
+        params = self.params
+        kwargs = {}
+
+        for param, arg in (('port_security_enabled', 'port_security_enabled'),
+                           ('mtu', 'mtu'),
+                           ('dns_domain', 'dns_domain'),
+                           ('shared', 'shared'),
+                           ('admin_state_up', 'admin_state_up'),
+                           ('external', 'is_router_external')):
+            if params[param] is not None:
+                kwargs[arg] = params[param]
+
+        for arg in ('provider_physical_network', 'provider_network_type',
+                    'provider_segmentation_id'):
+            if params[arg]:
+                kwargs[arg] = params[arg]
+
+        return kwargs
+
+    def _validate_update(self, net, kwargs):
+        """Fail if kwargs would change properties that cannot be updated."""
+        for arg in self.non_updatable_attrs:
+            if arg in kwargs and kwargs[arg] != getattr(net, arg):
+                self.fail_json(
+                    msg="The following parameters cannot be updated: "
+                        "%s. You will need to use state: absent and "
+                        "recreate." % ', '.join(self.non_updatable_attrs)
+                )
+
+    def _compute_update(self, net, kwargs):
+        """Return the subset of kwargs which differs from net."""
+        # Only update properties the user wants something specific for and
+        # which differ from what we have right now
+        update_kwargs = {}
+        for arg in self.updatable_attrs:
+            value = kwargs.get(arg)
+            if (value is not None
+                    and value != getattr(net, self.attr_mappings.get(arg, arg))):
+                update_kwargs[arg] = value
+        return update_kwargs
+
+    def _update_network(self, net, kwargs):
+        """Update net to match kwargs, returns (net, changed).
+
+        Callers have to check kwargs with _validate_update first.
+        """
+        update_kwargs = self._compute_update(net, kwargs)
+        if not update_kwargs:
+            return net, False
+
+        net = self.conn.network.update_network(net.id, **update_kwargs)
+        return net, True
+
+    def _network_result(self, net):
+        """Return net as a dict to be returned by the module."""
+        if self.params['return_network']:
+            return net.to_dict(computed=False)
+        return {'id': net.id, 'name': net.name}
+
+    def _find_project_id(self, project):
+        """Return the id of the project with the given name or id."""
+        # The id of the project we are authenticated to is known from the
+        # token already, so there is no need to ask Keystone about it.
+        if project == self.conn.current_project_id:
+            return project
+        return self.conn.identity.find_project(project,
+                                               ignore_missing=False).id
+
+    def _list_networks(self, query, names):
+        """List existing networks once, returns those in names by name."""
+        # Networks are looked up by name only, just like find_network does
+        # when no network with a matching id exists.
+        matches = {}
+        for net in self.conn.network.networks(**query):
+            if net.name in names:
+                matches.setdefault(net.name, []).append(net)
+
+        # Fail on ambiguous names like find_network does, for example when
+        # an admin lists networks of all projects
+        duplicates = [name for name in names if len(matches.get(name, [])) > 1]
+        if duplicates:
+            self.fail_json(
+                msg="More than one network exists with the name(s) %s. "
+                    "Use project to narrow down the networks to manage."
+                    % ', '.join(duplicates))
+
+        return dict((name, nets[0]) for name, nets in matches.items())
+
+    def _ensure_network(self, name, net, query, kwargs):
+        """Create or update a network, returns (net, changed)."""
+        if not net:
+            return self.conn.network.create_network(
+                name=name, **query, **kwargs), True
+        return self._update_network(net, kwargs)
+
+    def _run_parallel(self, func, names):
+        """Call func for each of names in parallel.
+
+        Returns a dict of results and a dict of SDK errors, both keyed by
+        name, so that partial success can be reported.
+        """
+        results = {}
+        errors = {}
+        with ThreadPoolExecutor(
+                max_workers=self.params['concurrency']) as executor:
+            futures = dict((executor.submit(func, name), name)
+                           for name in names)
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except self.sdk.exceptions.OpenStackCloudException as e:
+                    errors[name] = e
+        return results, errors
+
+    def _errors_msg(self, action, names, errors):
+        """Describe errors returned by _run_parallel in order of names."""
+        return "Failed to %s network(s): %s" % (
+            action, '; '.join('%s: %s' % (name, errors[name])
+                              for name in names if name in errors))
+
+    def _run_multiple(self, names, state, query):
+        """Manage all networks in names, listing existing ones only once."""
+        # Process every network once even if it has been listed twice
+        unique_names = list(dict.fromkeys(names))
+        existing = self._list_networks(query, unique_names)
+
+        if state == 'present':
+            kwargs = self._build_kwargs()
+            # Validate all updates before touching any network
+            for name in unique_names:
+                if existing.get(name):
+                    self._validate_update(existing[name], kwargs)
+
+            results, errors = self._run_parallel(
+                lambda name: self._ensure_network(
+                    name, existing.get(name), query, kwargs),
+                unique_names)
+
+            changed = False
+            for name, (net, net_changed) in results.items():
+                existing[name] = net
+                changed = changed or net_changed
+            networks = [self._network_result(existing[name])
+                        for name in names if name in results]
+            if errors:
+                self.fail_json(
+                    changed=changed, networks=networks,
+                    msg=self._errors_msg('create or update', unique_names,
+                                         errors))
+            self.exit(changed=changed, networks=networks)
+        elif state == 'absent':
+            results, errors = self._run_parallel(
+                lambda name: self.conn.network.delete_network(
+                    existing[name].id),
+                [name for name in unique_names if existing.get(name)])
+
+            changed = bool(results)
+            if errors:
+                self.fail_json(
+                    changed=changed,
+                    msg=self._errors_msg('delete', unique_names, errors))
+            self.exit(changed=changed)
+
     def run(self):
 
         state = self.params['state']
         name = self.params['name']
-        shared = self.params['shared']
-        admin_state_up = self.params['admin_state_up']
-        external = self.params['external']
-        provider_physical_network = self.params['provider_physical_network']
-        provider_network_type = self.params['provider_network_type']
-        provider_segmentation_id = self.params['provider_segmentation_id']
+        names = self.params['names']
         project = self.params['project']
 
-        kwargs = {}
-        for arg in ('port_security_enabled', 'mtu', 'dns_domain'):
-            if self.params[arg] is not None:
-                kwargs[arg] = self.params[arg]
-
-        if project is not None:
-            proj = self.conn.identity.find_project(project,
-                                                   ignore_missing=False)
-            project_id = proj['id']
-            net_kwargs = {'project_id': project_id}
-        else:
-            project_id = None
-            net_kwargs = {}
-        net = self.conn.network.find_network(name, **net_kwargs)
+        if self.params['concurrency'] < 1:
+            self.fail_json(msg="concurrency must be a positive integer")
+
+        # Scopes both lookups and creation of networks to the project
+        query = ({'project_id': self._find_project_id(project)}
+                 if project is not None else {})
+
+        if names is not None:
+            return self._run_multiple(names, state, query)
+
+        net = self.conn.network.find_network(name, **query)
 
         if state == 'present':
-            if provider_physical_network:
-                kwargs['provider_physical_network'] = provider_physical_network
-            if provider_network_type:
-                kwargs['provider_network_type'] = provider_network_type
-            if provider_segmentation_id:
-                kwargs['provider_segmentation_id'] = provider_segmentation_id
-
-            if project_id is not None:
-                kwargs['project_id'] = project_id
-
-            if shared is not None:
-                kwargs["shared"] = shared
-            if admin_state_up is not None:
-                kwargs["admin_state_up"] = admin_state_up
-            if external is not None:
-                kwargs["is_router_external"] = external
+            kwargs = self._build_kwargs()
 
             if not net:
-                net = self.conn.network.create_network(name=name, **kwargs)
+                net = self.conn.network.create_network(name=name, **query,
+                                                       **kwargs)
                 changed = True
             else:
-                changed = False
-                update_kwargs = {}
-
-                # Check we are not trying to update an properties that cannot
-                # be modified
-                non_updatables = [
-                    "provider_network_type",
-                    "provider_physical_network",
-                ]
-                for arg in non_updatables:
-                    if arg in kwargs and kwargs[arg] != net[arg]:
-                        self.fail_json(
-                            msg="The following parameters cannot be updated: "
-                                "%s. You will need to use state: absent and "
-                                "recreate." % ', '.join(non_updatables)
-                        )
-
-                # Filter args to update call to the ones that have been modifed
-                # and are updatable. Adapted from:
-                # https://github.com/openstack/openstacksdk/blob/1ce15c9a8758b4d978eb5239bae100ddc13c8875/openstack/cloud/_network.py#L559-L561
-                for arg in ["shared", "admin_state_up", "is_router_external",
-                            "mtu", "port_security_enabled", "dns_domain",
-                            "provider_segmentation_id"]:
-                    if (
-                        arg in kwargs
-                        # ensure user wants something specific
-                        and kwargs[arg] is not None
-                        # and this is not what we have right now
-                        and kwargs[arg] != net[arg]
-                    ):
-                        update_kwargs[arg] = kwargs[arg]
-
-                if update_kwargs:
-                    net = self.conn.network.update_network(
-                        net.id, **update_kwargs
-                    )
-                    changed = True
-
-            net = net.to_dict(computed=False)
+                self._validate_update(net, kwargs)
+                net, changed = self._update_network(net, kwargs)
+
+            net = self._network_result(net)
             self.exit(changed=changed, network=net, id=net['id'])
         elif state == 'absent':
             if not net:
                 self.exit(changed=False)
             else:
-                self.conn.network.delete_network(net['id'])
+                self.conn.network.delete_network(net.id)
                 self.exit(changed=True)
 
 